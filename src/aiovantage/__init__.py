@@ -1,9 +1,9 @@
 """Interact with and control Vantage InFusion home automation controllers."""
 
-__all__ = ["Vantage", "VantageEvent"]
+__all__ = ["Vantage", "VantageEvent", "install_uvloop"]
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from types import TracebackType
 from typing import Any, TypeVar, cast
 
@@ -40,6 +40,25 @@ from .models import SystemObject
 ControllerT = TypeVar("ControllerT", bound=BaseController[Any])
 
 
+def install_uvloop() -> bool:
+    """Use uvloop for new asyncio event loops, if it is installed.
+
+    uvloop is a faster drop-in replacement for the default asyncio event loop, which
+    helps on large systems with lots of events. This must be called before the event
+    loop is created, for example before calling asyncio.run().
+
+    Returns:
+        True if uvloop was installed, False if it isn't available.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 class Vantage:
     """Control a Vantage InFusion controller."""
 
@@ -100,6 +119,11 @@ class Vantage:
         self._temperature_sensors = self._add_controller(TemperatureSensorsController)
         self._thermostats = self._add_controller(ThermostatsController)
 
+        # Object status events from the Enhanced Log are routed directly to the
+        # controller that manages the object, using a single subscription
+        self._vid_owner: dict[int, BaseController[Any]] = {}
+        self._routing_enhanced_log = False
+
         # Subscribe to reconnect events from the event stream
         self._event_stream.subscribe(self._handle_event, EventType.RECONNECTED)
 
@@ -257,10 +281,12 @@ class Vantage:
             return None
 
     def close(self) -> None:
-        """Close the clients."""
+        """Close the clients, and stop the controllers."""
         self.config_client.close()
         self.command_client.close()
         self.event_stream.stop()
+        for controller in self._controllers:
+            controller.shutdown()
 
     async def initialize(self, fetch_state: bool = True) -> None:
         """Fetch all objects from the controllers.
@@ -302,6 +328,37 @@ class Vantage:
                 if controller.initialized:
                     await controller.fetch_full_state()
 
+    def _route_interface_status(
+        self, controller: BaseController[Any], vids: Iterable[int]
+    ) -> None:
+        # Route object status events for the given objects to a controller.
+        if not self._routing_enhanced_log:
+            self._event_stream.subscribe_enhanced_log(
+                self._route_enhanced_log, ("STATUS", "STATUSEX")
+            )
+            self._routing_enhanced_log = True
+
+        for vid in vids:
+            self._vid_owner[vid] = controller
+
+    def _unroute_interface_status(self, vids: Iterable[int]) -> None:
+        # Stop routing object status events for the given objects.
+        for vid in vids:
+            self._vid_owner.pop(vid, None)
+
+    def _route_enhanced_log(self, event: Event) -> None:
+        # Pass an Enhanced Log event to the controller that manages the object.
+        if event["type"] != EventType.ENHANCED_LOG:
+            return
+
+        vid, _, _ = event["log"].partition(" ")
+        if not vid.isdigit():
+            return
+
+        owner = self._vid_owner.get(int(vid))
+        if owner is not None:
+            owner._receive_event(event)
+
     def _add_controller(self, controller_cls: type[ControllerT]) -> ControllerT:
         # Add a controller to the known controllers.
         controller = controller_cls(self)
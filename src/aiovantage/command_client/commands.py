@@ -2,6 +2,8 @@
 
 import asyncio
 import logging
+import re
+from collections import deque
 from collections.abc import Sequence
 from dataclasses import dataclass
 from decimal import Decimal
@@ -12,6 +14,8 @@ from typing_extensions import Self
 
 from aiovantage.connection import BaseConnection
 from aiovantage.errors import (
+    ClientConnectionError,
+    ClientTimeoutError,
     CommandError,
     InvalidObjectError,
     LoginFailedError,
@@ -20,6 +24,23 @@ from aiovantage.errors import (
 
 from .utils import encode_params, tokenize_response
 
+# Prefixes of "event" messages that may be interleaved with command responses.
+# Lines are classified before decoding, so these are bytes.
+EVENT_PREFIXES = (b"S:", b"L:", b"EL:")
+
+# Prefix of the final line of a command response
+RESPONSE_PREFIX = b"R:"
+
+# Error responses, of the form "R:ERROR:<code> <message>"
+ERROR_PATTERN = re.compile(r"R:ERROR:(\d+) (.*)")
+
+# Error codes with a more specific exception type
+ERROR_CLASSES: dict[int, type[CommandError]] = {
+    7: InvalidObjectError,
+    21: LoginRequiredError,
+    23: LoginFailedError,
+}
+
 
 class CommandConnection(BaseConnection):
     """Connection to a Vantage Host Command service."""
@@ -28,7 +49,7 @@ class CommandConnection(BaseConnection):
     default_ssl_port = 3010
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandResponse:
     """Wrapper for command responses."""
 
@@ -38,7 +59,14 @@ class CommandResponse:
 
 
 class CommandClient:
-    """Client to send commands to the Vantage Host Command service."""
+    """Client to send commands to the Vantage Host Command service.
+
+    Requests are pipelined: concurrent callers can each send a request without
+    waiting for earlier responses. The controller responds to requests in the order
+    they were received, so a single reader task hands each response to the oldest
+    request still waiting for one. Requests sent during the same event loop
+    iteration are written to the connection together.
+    """
 
     def __init__(
         self,
@@ -57,7 +85,12 @@ class CommandClient:
         self._password = password
         self._read_timeout = read_timeout
         self._connection_lock = asyncio.Lock()
-        self._command_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+        self._pending: deque[asyncio.Future[list[bytes]]] = deque()
+        self._write_buffer = bytearray()
+        self._flush_scheduled = False
+        self._reader_task: asyncio.Task[None] | None = None
+        self._response_timer: asyncio.TimerHandle | None = None
         self._logger = logging.getLogger(__name__)
 
     async def __aenter__(self) -> Self:
@@ -77,7 +110,12 @@ class CommandClient:
 
     def close(self) -> None:
         """Close the connection to the Host Command service."""
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
+
         self._connection.close()
+        self._fail_pending()
 
     async def command(
         self,
@@ -122,34 +160,23 @@ class CommandClient:
         Returns:
             The response lines received from the server.
         """
-        conn = connection or await self.get_connection()
-
-        # Send the command
-        async with self._command_lock:
-            self._logger.debug("Sending command: %s", request)
-            await conn.write(f"{request}\n")
-
-            # Read all lines of the response
-            response_lines = []
-            while True:
-                response_line = await conn.readuntil(b"\r\n", self._read_timeout)
-                response_line = response_line.rstrip()
-
-                # Handle error codes
-                if response_line.startswith("R:ERROR"):
-                    raise self._parse_command_error(response_line)
-
-                # Ignore potentially interleaved "event" messages
-                if any(response_line.startswith(x) for x in ("S:", "L:", "EL:")):
-                    self._logger.debug("Ignoring event message: %s", response_line)
-                    continue
-
-                # Return the response once we see the response line
-                response_lines.append(response_line)
-                if response_line.startswith("R:"):
-                    break
+        if connection is None or connection is self._connection:
+            # Pipeline the request on the default connection. The read timeout
+            # starts once the reader reaches this request, so time spent queued
+            # behind other requests doesn't count towards it.
+            conn = connection or await self.get_connection()
+            raw_lines = await self._send(conn, request)
+        else:
+            # Other connections don't have a reader task, so send the request and
+            # read the response directly.
+            async with self._write_lock:
+                self._logger.debug("Sending command: %s", request)
+                await connection.write(f"{request}\n")
+                raw_lines = await self._read_response(connection, self._read_timeout)
 
-        self._logger.debug("Received response: %s", "\n".join(response_lines))
+        response_lines = [line.decode() for line in raw_lines]
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Received response: %s", "\n".join(response_lines))
 
         return response_lines
 
@@ -157,8 +184,13 @@ class CommandClient:
         """Get a connection to the Host Command service."""
         async with self._connection_lock:
             if self._connection.closed:
-                # Open a new connection
+                # Open a new connection, and start reading responses from it
                 await self._connection.open()
+                if self._reader_task is not None:
+                    self._reader_task.cancel()
+                self._reader_task = asyncio.create_task(
+                    self._response_reader(self._connection)
+                )
 
                 # Authenticate the new connection if we have credentials
                 if self._username and self._password:
@@ -177,20 +209,158 @@ class CommandClient:
 
             return self._connection
 
+    def _send(
+        self, conn: CommandConnection, request: str
+    ) -> asyncio.Future[list[bytes]]:
+        # Queue a request, and return a future that resolves to its response lines.
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[list[bytes]] = loop.create_future()
+
+        # Queue the future and buffer the request together, so responses are matched
+        # to requests in the order they were sent.
+        self._logger.debug("Sending command: %s", request)
+        self._pending.append(future)
+        self._write_buffer += f"{request}\n".encode()
+
+        # Start timing the response if the reader is waiting for this request
+        if len(self._pending) == 1:
+            self._start_response_timer(conn)
+
+        # Write all requests buffered during this event loop iteration at once
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.call_soon(self._flush_writes, conn)
+
+        return future
+
+    def _flush_writes(self, conn: CommandConnection) -> None:
+        # Write all buffered requests to the connection in a single write.
+        self._flush_scheduled = False
+        if not self._write_buffer:
+            return
+
+        data = bytes(self._write_buffer)
+        self._write_buffer.clear()
+        try:
+            conn.write_nowait(data)
+        except ClientConnectionError:
+            conn.close()
+            self._fail_pending()
+
+    async def _response_reader(self, conn: CommandConnection) -> None:
+        # Read responses from a connection, and resolve pending requests in order.
+        while True:
+            exc: CommandError | None = None
+            try:
+                raw_lines = await self._read_response(conn)
+            except CommandError as err:
+                exc = err
+            except ClientConnectionError:
+                break
+            except Exception:
+                self._logger.exception("Unexpected error while reading responses")
+                break
+
+            if not self._pending:
+                self._logger.warning("Received a response with no pending request")
+                continue
+
+            # Start timing the response to the next request. Requests that were
+            # cancelled are still queued, their responses are dropped
+            future = self._pending.popleft()
+            self._start_response_timer(conn)
+            if future.done():
+                continue
+
+            if exc is not None:
+                future.set_exception(exc)
+            else:
+                future.set_result(raw_lines)
+
+        # The connection is no longer usable, fail any requests awaiting a response
+        conn.close()
+        self._fail_pending()
+
+    async def _read_response(
+        self, conn: CommandConnection, timeout: float | None = None
+    ) -> list[bytes]:
+        # Read the lines of a single response, up to and including the "R:" line.
+        # Avoid formatting debug messages for every line when debug logging is off
+        log_debug = self._logger.isEnabledFor(logging.DEBUG)
+
+        # Only the lines we keep are decoded, by the caller. Bind the per-line
+        # methods once, since multi-line responses can be thousands of lines long.
+        raw_lines: list[bytes] = []
+        append = raw_lines.append
+        readline = conn.readline
+        while True:
+            raw_line = await readline(timeout)
+
+            # Ignore potentially interleaved "event" messages
+            if raw_line.startswith(EVENT_PREFIXES):
+                if log_debug:
+                    self._logger.debug("Ignoring event message: %s", raw_line.decode())
+                continue
+
+            # Return the response once we see the response line
+            if raw_line.startswith(RESPONSE_PREFIX):
+                # Handle error codes
+                if raw_line[:7] == b"R:ERROR":
+                    raise self._parse_command_error(raw_line.decode())
+
+                append(raw_line)
+                return raw_lines
+
+            append(raw_line)
+
+    def _start_response_timer(self, conn: CommandConnection) -> None:
+        # Time out the response to the oldest pending request, replacing any timer
+        # for the previous request.
+        if self._response_timer is not None:
+            self._response_timer.cancel()
+            self._response_timer = None
+
+        if self._pending:
+            self._response_timer = asyncio.get_running_loop().call_later(
+                self._read_timeout, self._response_timeout, conn
+            )
+
+    def _response_timeout(self, conn: CommandConnection) -> None:
+        # The controller didn't respond in time. Close the connection so that a late
+        # response can't be matched to a later request, and fail the pending requests.
+        self._response_timer = None
+        self._logger.warning("Timed out waiting for a response, closing connection")
+        conn.close()
+        self._fail_pending(ClientTimeoutError, "Timed out waiting for response")
+
+    def _fail_pending(
+        self,
+        error_cls: type[ClientConnectionError] = ClientConnectionError,
+        message: str = "Connection closed before response received",
+    ) -> None:
+        # Fail all requests that are still waiting for a response, and drop any
+        # requests that haven't been written yet.
+        if self._response_timer is not None:
+            self._response_timer.cancel()
+            self._response_timer = None
+
+        self._write_buffer.clear()
+        while self._pending:
+            future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(error_cls(message))
+
     def _parse_command_error(self, message: str) -> CommandError:
         # Parse a command error from a message.
-        tag, error_message = message.split(" ", 1)
-        _, _, error_code_str = tag.split(":")
-        error_code = int(error_code_str)
-
-        exc: CommandError
-        if error_code == 7:
-            exc = InvalidObjectError(error_message)
-        elif error_code == 21:
-            exc = LoginRequiredError(error_message)
-        elif error_code == 23:
-            exc = LoginFailedError(error_message)
-        else:
-            exc = CommandError(f"{error_message} (Error code {error_code})")
+        match = ERROR_PATTERN.match(message)
+        if match is None:
+            return CommandError(message)
+
+        error_code = int(match.group(1))
+        error_message = match.group(2)
+
+        error_cls = ERROR_CLASSES.get(error_code)
+        if error_cls is None:
+            return CommandError(f"{error_message} (Error code {error_code})")
 
-        return exc
+        return error_cls(error_message)
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import sys
 from collections import defaultdict
 from collections.abc import Awaitable, Callable, Iterable, Sequence
 from contextlib import suppress
@@ -298,8 +299,7 @@ class EventStream:
 
                 # Wait for new messages
                 while True:
-                    message = await conn.readuntil(b"\r\n")
-                    message = message.rstrip()
+                    message = (await conn.readline()).decode()
                     self._logger.debug("Received message: %s", message)
                     self._parse_message(message)
 
@@ -367,7 +367,7 @@ class EventStream:
             self.emit(
                 {
                     "type": EventType.STATUS,
-                    "status_type": status_type[2:],
+                    "status_type": sys.intern(status_type[2:]),
                     "id": int(id_str),
                     "args": args,
                 }
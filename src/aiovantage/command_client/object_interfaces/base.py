@@ -18,6 +18,20 @@ class Interface:
 
     method_signatures: dict[str, type[Any] | None] = {}
 
+    # Method signatures of this interface and all of its parents, flattened so
+    # that looking up a signature doesn't need to walk the MRO on every response.
+    _signatures: dict[str, type[Any] | None] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Build the flattened method signature lookup for each subclass."""
+        super().__init_subclass__(**kwargs)
+
+        # Walk the MRO in reverse, so signatures from earlier classes take precedence
+        cls._signatures = {}
+        for klass in reversed(cls.__mro__):
+            if issubclass(klass, Interface):
+                cls._signatures.update(klass.method_signatures)
+
     def __init__(self, client: CommandClient) -> None:
         """Initialize an object interface for standalone use.
 
@@ -131,8 +145,4 @@ class Interface:
     @classmethod
     def _get_signature(cls, method: str) -> type[Any] | None:
         # Get the signature of a method.
-        for klass in cls.__mro__:
-            if issubclass(klass, Interface) and method in klass.method_signatures:
-                return klass.method_signatures[method]
-
-        return None
+        return cls._signatures.get(method)
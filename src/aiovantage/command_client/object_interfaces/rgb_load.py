@@ -1,5 +1,6 @@
 """Interface for querying and controlling RGB loads."""
 
+import asyncio
 from decimal import Decimal
 from enum import IntEnum
 from typing import NamedTuple
@@ -257,7 +258,9 @@ class RGBLoadInterface(Interface):
         Returns:
             The value of the RGB color as a tuple of (red, green, blue).
         """
-        return tuple([await self.get_rgb(vid, attr) for attr in range(3)])
+        return tuple(
+            await asyncio.gather(*[self.get_rgb(vid, chan) for chan in range(3)])
+        )
 
     async def get_rgbw_color(self, vid: int) -> tuple[int, ...]:
         """Get the RGBW color of a load from the controller.
@@ -268,7 +271,9 @@ class RGBLoadInterface(Interface):
         Returns:
             The value of the RGBW color as a tuple of (red, green, blue, white).
         """
-        return tuple([await self.get_rgbw(vid, chan) for chan in range(4)])
+        return tuple(
+            await asyncio.gather(*[self.get_rgbw(vid, chan) for chan in range(4)])
+        )
 
     async def get_hsl_color(self, vid: int) -> tuple[int, ...]:
         """Get the HSL color of a load from the controller.
@@ -279,4 +284,6 @@ class RGBLoadInterface(Interface):
         Returns:
             The value of the HSL color as a tuple of (hue, saturation, lightness).
         """
-        return tuple([await self.get_hsl(vid, attr) for attr in range(3)])
+        return tuple(
+            await asyncio.gather(*[self.get_hsl(vid, chan) for chan in range(3)])
+        )
@@ -2,15 +2,20 @@
 
 import re
 import struct
+from collections.abc import Callable
 from decimal import Decimal
 from enum import IntEnum
 from typing import Any, TypeVar, cast
 
-TOKEN_PATTERN = re.compile(r'"([^""]*(?:""[^""]*)*)"|(\{.*?\})|(\[.*?\])|(\S+)')
+# Plain words in responses run until the next whitespace
+WORD_PATTERN = re.compile(r"\S+")
 
 T = TypeVar("T")
 ParameterType = str | bool | int | float | Decimal | bytearray
 
+# Fixed-point values are sent as thousandths
+FIXED_POINT_SCALE = Decimal(1000)
+
 
 def tokenize_response(string: str) -> list[str]:
     """Tokenize a response from the Host Command service.
@@ -23,17 +28,73 @@ def tokenize_response(string: str) -> list[str]:
     Returns:
         A list of string tokens.
     """
-    tokens = []
-    for match in TOKEN_PATTERN.finditer(string):
-        token = match.group(0)
+    # Most responses are plain words, which a simple split handles
+    if '"' not in string and "{" not in string and "[" not in string:
+        return string.split()
+
+    tokens: list[str] = []
+    length = len(string)
+    pos = 0
+    while pos < length:
+        char = string[pos]
+
+        # Skip the whitespace between tokens
+        if char.isspace():
+            pos += 1
+            continue
+
+        # Quoted strings are unquoted and unescaped, byte arrays are kept as-is.
+        # Unterminated quotes or brackets fall through and are treated as words.
+        end = -1
+        if char == '"':
+            end = _scan_quoted_string(string, pos, tokens)
+        elif char == "{":
+            end = string.find("}", pos + 1)
+            if end >= 0:
+                tokens.append(string[pos : end + 1])
+        elif char == "[":
+            end = string.find("]", pos + 1)
+            if end >= 0:
+                tokens.append(string[pos : end + 1])
+
+        # Plain words run until the next whitespace
+        if end < 0:
+            match = WORD_PATTERN.match(string, pos)
+            end = match.end() if match else length
+            tokens.append(string[pos:end])
+            pos = end
+        else:
+            pos = end + 1
 
-        # Remove quotes from quoted strings, and unescape quotes
-        if token.startswith('"') and token.endswith('"'):
-            token = token[1:-1].replace('""', '"')
+    return tokens
 
-        tokens.append(token)
 
-    return tokens
+def _scan_quoted_string(string: str, start: int, tokens: list[str]) -> int:
+    # Scan a quoted string starting at the opening quote, appending the unescaped
+    # contents to tokens. Returns the index of the closing quote, or -1 if the string
+    # is unterminated. Doubled quotes ("") are escaped quotes.
+    chunks: list[str] = []
+    pos = start + 1
+    while True:
+        end = string.find('"', pos)
+        if end < 0:
+            if not chunks:
+                return -1
+
+            # No closing quote after the last escaped quote, so treat the first
+            # quote of that pair as the closing quote instead.
+            chunks[-1] = chunks[-1][:-1]
+            tokens.append("".join(chunks))
+            return pos - 2
+
+        if string.startswith('"', end + 1):
+            # Escaped quote, keep one quote and continue scanning
+            chunks.append(string[pos : end + 1])
+            pos = end + 2
+        else:
+            chunks.append(string[pos:end])
+            tokens.append(chunks[0] if len(chunks) == 1 else "".join(chunks))
+            return end
 
 
 def parse_param(arg: str, klass: type[T]) -> T:
@@ -89,20 +150,13 @@ def encode_params(*params: ParameterType, force_quotes: bool = False) -> str:
     """
     encoded_params = []
     for value in params:
-        if isinstance(value, str):
-            encoded_param = encode_string_param(value, force_quotes)
-        elif isinstance(value, bool):
-            encoded_param = "1" if value else "0"
-        elif isinstance(value, int):
-            encoded_param = str(value)
-        elif isinstance(value, float | Decimal):
-            encoded_param = f"{value:.3f}"
-        elif isinstance(value, bytearray):
-            encoded_param = encode_byte_param(value)
-        else:
-            raise TypeError(f"Invalid value type: {type(value)}")
+        # Look up the encoder by exact type first, falling back to an isinstance
+        # check for subclasses (eg. IntEnum)
+        encoder = PARAM_ENCODERS.get(type(value))
+        if encoder is None:
+            encoder = _find_param_encoder(value)
 
-        encoded_params.append(encoded_param)
+        encoded_params.append(encoder(value, force_quotes))
 
     return " ".join(encoded_params)
 
@@ -110,7 +164,10 @@ def encode_params(*params: ParameterType, force_quotes: bool = False) -> str:
 def parse_fixed_param(param: str) -> Decimal:
     """Parse a fixed-point parameter from the Host Command service."""
     # Handles both 123000 and 123.000 style fixed-point values
-    return Decimal(param.replace(".", "")) / 1000
+    if "." in param:
+        param = param.replace(".", "")
+
+    return Decimal(param) / FIXED_POINT_SCALE
 
 
 def parse_string_param(param: str) -> str:
@@ -142,7 +199,7 @@ def encode_string_param(param: str, force_quotes: bool = False) -> str:
     Returns:
         The encoded parameter.
     """
-    if '"' in param or " " in param or force_quotes:
+    if force_quotes or '"' in param or " " in param:
         param = param.replace('"', '""')
         return f'"{param}"'
 
@@ -192,3 +249,44 @@ def encode_byte_param(byte_array: bytearray) -> str:
     data = "{" + ",".join(tokens) + "}"
 
     return data
+
+
+def _encode_bool_param(value: bool, _force_quotes: bool) -> str:
+    # Encode a boolean parameter as 1 or 0.
+    return "1" if value else "0"
+
+
+def _encode_int_param(value: int, _force_quotes: bool) -> str:
+    # Encode an integer parameter.
+    return str(value)
+
+
+def _encode_fixed_param(value: float | Decimal, _force_quotes: bool) -> str:
+    # Encode a float or decimal parameter as a fixed-point value.
+    return f"{value:.3f}"
+
+
+def _encode_byte_param(value: bytearray, _force_quotes: bool) -> str:
+    # Encode a byte array parameter.
+    return encode_byte_param(value)
+
+
+# Parameter encoders, keyed by exact parameter type
+PARAM_ENCODERS: dict[type[Any], Callable[[Any, bool], str]] = {
+    str: encode_string_param,
+    bool: _encode_bool_param,
+    int: _encode_int_param,
+    float: _encode_fixed_param,
+    Decimal: _encode_fixed_param,
+    bytearray: _encode_byte_param,
+}
+
+
+def _find_param_encoder(value: Any) -> Callable[[Any, bool], str]:
+    # Find the encoder for a parameter whose type is a subclass of a supported type.
+    # Checked in order, since bool is a subclass of int.
+    for klass, encoder in PARAM_ENCODERS.items():
+        if isinstance(value, klass):
+            return encoder
+
+    raise TypeError(f"Invalid value type: {type(value)}")
@@ -19,12 +19,13 @@ import asyncio
 import logging
 from ssl import SSLContext
 from types import TracebackType
-from xml.etree import ElementTree
+from typing import Any
 
 from typing_extensions import Self
+from xsdata.exceptions import ParserError
+from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.parsers import XmlParser
 from xsdata.formats.dataclass.parsers.config import ParserConfig
-from xsdata.formats.dataclass.parsers.handlers import XmlEventHandler
 from xsdata.formats.dataclass.serializers import XmlSerializer
 from xsdata.formats.dataclass.serializers.config import SerializerConfig
 
@@ -35,6 +36,25 @@ from .interfaces import Call, Method, Return
 from .interfaces.introspection import GetSysInfo
 from .interfaces.login import Login
 
+# Use lxml to parse responses if it is installed, since it is significantly faster
+# than the builtin ElementTree parser. Elements must be walked by the matching handler.
+try:
+    from lxml import etree
+    from xsdata.formats.dataclass.parsers.handlers import (
+        LxmlEventHandler as EventHandler,
+    )
+except ImportError:  # pragma: no cover
+    from xml.etree import ElementTree as etree  # noqa: N813
+
+    from xsdata.formats.dataclass.parsers.handlers import (  # type: ignore[assignment]
+        XmlEventHandler as EventHandler,
+    )
+
+
+# The maximum number of bytes to read from the connection at a time, when
+# incrementally parsing responses
+READ_CHUNK_SIZE = 2**16
+
 
 class ConfigConnection(BaseConnection):
     """Connection to a Vantage ACI server."""
@@ -68,13 +88,19 @@ class ConfigClient:
         self._password = password
         self._read_timeout = read_timeout
 
+        # Share the binding metadata between the serializer and parser, so it is only
+        # built once for each class
+        context = XmlContext()
+
         self._serializer = XmlSerializer(
             config=SerializerConfig(xml_declaration=False),
+            context=context,
         )
 
         self._parser = XmlParser(
             config=ParserConfig(fail_on_unknown_properties=False),
-            handler=XmlEventHandler,
+            context=context,
+            handler=EventHandler,
         )
         self._connection_lock = asyncio.Lock()
         self._request_lock = asyncio.Lock()
@@ -115,23 +141,8 @@ class ConfigClient:
         Returns:
             The raw XML response.
         """
-        # Open the connection if it's closed
-        conn = connection or await self.get_connection()
-
-        # Render the method object to XML with xsdata
-        request = f"<{interface}>{raw_method}</{interface}>"
-        self._logger.debug("Sending request: %s", request)
-
-        # Send the request and read the response
-        async with self._request_lock:
-            await conn.write(request)
-            response = await conn.readuntil(
-                f"</{interface}>\n".encode(), timeout=self._read_timeout
-            )
-
-        self._logger.debug("Received response: %s", response)
-
-        return response
+        response = await self._raw_request(interface, raw_method, connection)
+        return response.decode()
 
     async def request(
         self,
@@ -153,14 +164,12 @@ class ConfigClient:
         method = method_cls()
         method.call = params
 
-        # Render the method object to XML with xsdata and send the request
-        response = await self.raw_request(
+        # Render the method object to XML with xsdata, send the request, and parse
+        # the response as it is received
+        root = await self._stream_request(
             method.interface, self._serializer.render(method), connection
         )
 
-        # Parse the XML doc
-        root = ElementTree.fromstring(response)
-
         # Response root must match the tag of the request
         if root.tag != method.interface:
             raise ClientResponseError(
@@ -168,8 +177,8 @@ class ConfigClient:
             )
 
         # Responses must contain the method element and a return element
-        method_el = root.find(f"./{method_cls.__name__}")
-        return_el = root.find(f"./{method_cls.__name__}/return")
+        method_el = root.find(method_cls.__name__)
+        return_el = None if method_el is None else method_el.find("return")
         if method_el is None or return_el is None:
             raise ClientResponseError("Response is missing method or return element")
 
@@ -180,9 +189,10 @@ class ConfigClient:
             return None
 
         # Parse the method element with xsdata
-        method = self._parser.parse(method_el, method_cls)
-        if method.return_value is None:
-            return None
+        try:
+            method = self._parser.parse(method_el, method_cls)
+        except ParserError as err:
+            raise ClientResponseError(f"Failed to parse response: {err}") from err
 
         return method.return_value
 
@@ -222,3 +232,93 @@ class ConfigClient:
                 )
 
             return self._connection
+
+    async def _raw_request(
+        self,
+        interface: str,
+        raw_method: str,
+        connection: ConfigConnection | None = None,
+    ) -> bytes:
+        # Send a raw request to the ACI service and return the undecoded response.
+        # Open the connection if it's closed
+        conn = connection or await self.get_connection()
+
+        # Wrap the method in the interface element
+        request = f"<{interface}>{raw_method}</{interface}>"
+        self._logger.debug("Sending request: %s", request)
+
+        # Send the request and read the response
+        async with self._request_lock:
+            await conn.write(request)
+            response = await conn.readuntil_bytes(
+                f"</{interface}>\n".encode(), timeout=self._read_timeout
+            )
+
+        # Streamed requests stop reading at the end of the root element, so the
+        # newline that follows it can still be unread at the start of this response
+        response = response.lstrip()
+
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Received response: %s", response.decode())
+
+        return response
+
+    async def _stream_request(
+        self,
+        interface: str,
+        raw_method: str,
+        connection: ConfigConnection | None = None,
+    ) -> Any:
+        # Send a raw request to the ACI service, and incrementally parse the response
+        # as it arrives, rather than buffering the whole response before parsing it.
+        # Returns the root element of the response.
+        conn = connection or await self.get_connection()
+
+        # Wrap the method in the interface element
+        request = f"<{interface}>{raw_method}</{interface}>"
+        self._logger.debug("Sending request: %s", request)
+
+        # Keep a copy of the raw response for debug logging only
+        log_chunks: list[bytes] | None = (
+            [] if self._logger.isEnabledFor(logging.DEBUG) else None
+        )
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._read_timeout
+        parser = etree.XMLPullParser(events=("start", "end"))
+        root: Any = None
+
+        async with self._request_lock:
+            await conn.write(request)
+
+            try:
+                done = False
+                while not done:
+                    chunk = await conn.read(
+                        READ_CHUNK_SIZE, timeout=max(deadline - loop.time(), 0)
+                    )
+
+                    # Skip the newline that trails the previous response
+                    if root is None:
+                        chunk = chunk.lstrip()
+
+                    if log_chunks is not None:
+                        log_chunks.append(chunk)
+
+                    # Stop reading once the root element has been closed
+                    parser.feed(chunk)
+                    for event, element in parser.read_events():
+                        if root is None:
+                            root = element
+                        elif event == "end" and element is root:
+                            done = True
+            except SyntaxError as err:
+                # Both lxml and ElementTree raise subclasses of SyntaxError. The rest of
+                # the response is still unread, so drop the connection.
+                conn.close()
+                raise ClientResponseError(f"Malformed response: {err}") from err
+
+        if log_chunks is not None:
+            self._logger.debug("Received response: %s", b"".join(log_chunks).decode())
+
+        return root
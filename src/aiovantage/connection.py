@@ -110,6 +110,22 @@ class BaseConnection:
         except OSError as err:
             raise ClientConnectionError from err
 
+    def write_nowait(self, data: bytes) -> None:
+        """Send raw bytes, without waiting for the write buffer to drain.
+
+        Args:
+            data: The data to send, as bytes.
+        """
+        # Make sure we're connected
+        if self._writer is None or self._writer.is_closing():
+            raise ClientConnectionError("Client not connected.")
+
+        # Send the request
+        try:
+            self._writer.write(data)
+        except OSError as err:
+            raise ClientConnectionError from err
+
     async def readuntil(self, separator: bytes, timeout: float | None = None) -> str:
         """Read data until the separator is found or the optional timeout is reached.
 
@@ -120,6 +136,33 @@ class BaseConnection:
         Returns:
             The data read, as a string.
         """
+        data = await self.readuntil_bytes(separator, timeout)
+        return data.decode()
+
+    async def readline(self, timeout: float | None = None) -> bytes:
+        """Read a single CRLF-terminated line or until the optional timeout is reached.
+
+        Args:
+            timeout: The optional timeout in seconds.
+
+        Returns:
+            The line read, as undecoded bytes, without the line terminator.
+        """
+        data = await self.readuntil_bytes(b"\r\n", timeout)
+        return data[:-2]
+
+    async def readuntil_bytes(
+        self, separator: bytes, timeout: float | None = None
+    ) -> bytes:
+        """Read data until the separator is found or the optional timeout is reached.
+
+        Args:
+            separator: The separator to read until.
+            timeout: The optional timeout in seconds.
+
+        Returns:
+            The data read, as undecoded bytes.
+        """
         # Make sure we're connected
         if self._reader is None or self.closed:
             raise ClientConnectionError("Client not connected.")
@@ -132,4 +175,32 @@ class BaseConnection:
         except (OSError, asyncio.IncompleteReadError) as err:
             raise ClientConnectionError from err
 
-        return data.decode()
+        return data
+
+    async def read(self, size: int, timeout: float | None = None) -> bytes:
+        """Read up to size bytes, or until the optional timeout is reached.
+
+        Args:
+            size: The maximum number of bytes to read.
+            timeout: The optional timeout in seconds.
+
+        Returns:
+            The data read, as undecoded bytes.
+        """
+        # Make sure we're connected
+        if self._reader is None or self.closed:
+            raise ClientConnectionError("Client not connected.")
+
+        # Read whatever is available, with optional timeout
+        try:
+            data = await asyncio.wait_for(self._reader.read(size), timeout)
+        except asyncio.TimeoutError as err:
+            raise ClientTimeoutError from err
+        except OSError as err:
+            raise ClientConnectionError from err
+
+        # An empty read means the connection was closed
+        if not data:
+            raise ClientConnectionError("Connection closed by controller.")
+
+        return data
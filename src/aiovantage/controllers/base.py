@@ -2,10 +2,12 @@
 
 import asyncio
 import logging
-from collections.abc import Callable, Iterable
+import sys
+from collections.abc import Awaitable, Callable, Iterable, KeysView
 from dataclasses import fields
 from inspect import iscoroutinefunction
-from typing import TYPE_CHECKING, Any, Literal, TypeVar
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar, cast
 
 from aiovantage.command_client import CommandClient, Event, EventStream, EventType
 from aiovantage.command_client.utils import tokenize_response
@@ -21,8 +23,70 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound=SystemObject)
 
 
-# Types for state and subscriptions
-EventSubscription = tuple[EventCallback[T], Iterable[VantageEvent] | None]
+# The maximum number of coroutine event callbacks each controller runs concurrently
+CALLBACK_WORKERS = 8
+
+# The maximum number of objects to fetch the state of concurrently
+FETCH_STATE_CONCURRENCY = 32
+
+
+class Subscription(Generic[T]):
+    """A callback subscribed to events from a controller."""
+
+    __slots__ = ("callback", "is_coroutine")
+
+    def __init__(self, callback: EventCallback[T]) -> None:
+        """Initialize the subscription.
+
+        Args:
+            callback: The callback to call when an event is emitted.
+        """
+        self.callback = callback
+        self.is_coroutine = iscoroutinefunction(callback)
+
+
+# Types for state and subscriptions. Callbacks are indexed by the event types
+# they are subscribed to, so emitting an event doesn't need to filter them.
+EventSubscriptions = dict[VantageEvent, list[Subscription[T]]]
+QueuedCallback = tuple[EventCallback[T], VantageEvent, T, dict[str, Any]]
+
+
+# The configuration field names of each object type, and a getter for their values.
+# See _config_fields.
+ConfigFields = tuple[tuple[str, ...], Callable[[Any], tuple[Any, ...]]]
+CONFIG_FIELDS: dict[type[SystemObject], ConfigFields] = {}
+
+
+def _config_fields(cls: type[SystemObject]) -> ConfigFields:
+    # Get the names of the configuration fields of an object type, and a getter that
+    # returns their values as a tuple, cached per type. Excludes the mtime field and
+    # any state fields, which aren't part of the configuration fetched from the ACI
+    # service.
+    if (config_fields := CONFIG_FIELDS.get(cls)) is None:
+        names = tuple(
+            field.name
+            for field in fields(cls)
+            if field.name != "mtime" and field.metadata.get("type") != "Ignore"
+        )
+
+        # Objects always have several configuration fields (id, name, ...), so the
+        # getter always returns a tuple
+        getter: Callable[[Any], tuple[Any, ...]] = attrgetter(*names)
+        config_fields = CONFIG_FIELDS[cls] = (names, getter)
+
+    return config_fields
+
+
+# The names of all fields of each object type, see _field_names
+FIELD_NAMES: dict[type[SystemObject], frozenset[str]] = {}
+
+
+def _field_names(cls: type[SystemObject]) -> frozenset[str]:
+    # Get the names of all fields of an object type, cached per type.
+    if (names := FIELD_NAMES.get(cls)) is None:
+        names = FIELD_NAMES[cls] = frozenset(field.name for field in fields(cls))
+
+    return names
 
 
 class BaseController(QuerySet[T]):
@@ -47,10 +111,15 @@ class BaseController(QuerySet[T]):
         self._items: dict[int, T] = {}
         self._logger = logging.getLogger(__package__)
         self._subscribed_to_state_changes = False
-        self._subscriptions: list[EventSubscription[T]] = []
-        self._id_subscriptions: dict[int, list[EventSubscription[T]]] = {}
+        self._subscriptions: EventSubscriptions[T] = {}
+        self._id_subscriptions: dict[int, EventSubscriptions[T]] = {}
         self._initialized = False
         self._lock = asyncio.Lock()
+        self._pending_state: dict[int, dict[str, Any]] | None = None
+        self._handling_event = False
+        self._callback_loop: asyncio.AbstractEventLoop | None = None
+        self._callback_queue: asyncio.Queue[QueuedCallback[T]] | None = None
+        self._callback_workers: set[asyncio.Task[None]] = set()
 
         QuerySet.__init__(self, self._items, self._lazy_initialize)
 
@@ -93,9 +162,9 @@ class BaseController(QuerySet[T]):
         return bool(self.status_types or self.interface_status_types)
 
     @property
-    def known_ids(self) -> set[int]:
-        """Return a set of all known object IDs."""
-        return set(self._items.keys())
+    def known_ids(self) -> KeysView[int]:
+        """Return a live, read-only view of all known object IDs."""
+        return self._items.keys()
 
     async def fetch_object_state(self, _vid: int) -> None:
         """Fetch the full state of an object.
@@ -131,42 +200,68 @@ class BaseController(QuerySet[T]):
         # Prevent concurrent controller initialization from multiple tasks, since we
         # are batch-modifying the _items dict.
         async with self._lock:
-            prev_ids = set(self._items.keys())
             cur_ids = set()
-
-            # Fetch all objects managed by this controller
-            async for obj in get_objects(self.config_client, types=self.vantage_types):
-                if obj.id in prev_ids:
+            new_ids = []
+
+            # Fetch all objects managed by this controller before applying any
+            # changes, so the objects are updated in one pass without awaiting. If the
+            # fetch fails, the controller is left unchanged.
+            objects = [
+                obj
+                async for obj in get_objects(
+                    self.config_client, types=self.vantage_types
+                )
+            ]
+
+            for obj in objects:
+                if obj.id in self._items:
                     # This is an existing object.
                     # Update any attributes that have changed and notify subscribers.
                     # Ignore the mtime attribute, and any state attributes.
-                    self.update_state(
-                        obj.id,
-                        {
-                            field.name: getattr(obj, field.name)
-                            for field in fields(type(obj))
-                            if field.name != "mtime"
-                            and field.metadata.get("type") != "Ignore"
-                        },
-                    )
+                    prev_obj = self._items[obj.id]
+                    names, getter = _config_fields(type(obj))
+                    values = getter(obj)
+
+                    if type(prev_obj) is not type(obj):
+                        # The object type changed, so pass every field
+                        self.update_state(obj.id, dict(zip(names, values, strict=True)))
+                    elif (prev_values := getter(prev_obj)) != values:
+                        # Compare all the values at once, then pass the ones that changed
+                        self.update_state(
+                            obj.id,
+                            {
+                                name: value
+                                for name, prev_value, value in zip(
+                                    names, prev_values, values, strict=True
+                                )
+                                if prev_value != value
+                            },
+                        )
                 else:
                     # This is a new object.
                     # Add it to the controller and notify subscribers
                     self._items[obj.id] = obj
                     self.emit(VantageEvent.OBJECT_ADDED, obj)
-
-                    # Fetch the state of stateful objects
-                    if self.stateful and fetch_state:
-                        await self.fetch_object_state(obj.id)
+                    new_ids.append(obj.id)
 
                 # Keep track of which objects we've seen
                 cur_ids.add(obj.id)
 
             # Handle objects that were removed
-            for vid in prev_ids - cur_ids:
+            removed_ids = self._items.keys() - cur_ids
+            for vid in removed_ids:
                 obj = self._items.pop(vid)
                 self.emit(VantageEvent.OBJECT_DELETED, obj)
 
+            # Keep object status events routed to this controller up to date
+            if self._subscribed_to_state_changes and self.interface_status_types:
+                self._vantage._unroute_interface_status(removed_ids)
+                self._vantage._route_interface_status(self, new_ids)
+
+            # Fetch the state of new stateful objects
+            if self.stateful and fetch_state:
+                await self._fetch_object_states(new_ids)
+
         # Subscribe to state changes for objects managed by this controller
         if fetch_state and len(self._items) > 0:
             await self.subscribe_to_state_changes()
@@ -184,8 +279,7 @@ class BaseController(QuerySet[T]):
         if not self.stateful:
             return
 
-        for obj in self._items.values():
-            await self.fetch_object_state(obj.id)
+        await self._fetch_object_states(self._items.keys())
 
         self._logger.info("%s fetched state", type(self).__name__)
 
@@ -199,19 +293,26 @@ class BaseController(QuerySet[T]):
 
         # Subscribe to "STATUS {type}" updates, if this controller cares about them.
         if self.status_types:
-            self.event_stream.subscribe_status(self._handle_event, self.status_types)
+            self.event_stream.subscribe_status(self._receive_event, self.status_types)
 
         # Some state changes are only available from "object" status events.
         # These can be subscribed to by using "STATUSADD {vid}" or "ELLOG STATUS".
         if self.interface_status_types:
-            # Subscribe to "object status" events from the Enhanced Log.
-            self.event_stream.subscribe_enhanced_log(
-                self._handle_event, ("STATUS", "STATUSEX")
-            )
+            # Subscribe to "object status" events from the Enhanced Log, these
+            # are routed to the controller that manages each object by Vantage.
+            self._vantage._route_interface_status(self, self._items.keys())
 
         self._subscribed_to_state_changes = True
         self._logger.info("%s subscribed to state changes", type(self).__name__)
 
+    def shutdown(self) -> None:
+        """Stop awaiting event callbacks for this controller.
+
+        Callbacks that are still queued are dropped. The callback workers are started
+        again the next time an event is emitted to a coroutine callback.
+        """
+        self._stop_callback_workers()
+
     def subscribe(
         self,
         callback: EventCallback[T],
@@ -228,34 +329,45 @@ class BaseController(QuerySet[T]):
         Returns:
             A function to unsubscribe from the callback.
         """
-        # Handle single ID filter or single event filter
+        # Handle a single ID filter
         if isinstance(id_filter, int):
             id_filter = (id_filter,)
 
-        if isinstance(event_filter, VantageEvent):
-            event_filter = (event_filter,)
-
-        # Create the subscription
-        subscription = (callback, event_filter)
+        # Subscribe to every event type if there is no event filter
+        event_types: Iterable[VantageEvent]
+        if event_filter is None:
+            event_types = VantageEvent
+        elif isinstance(event_filter, VantageEvent):
+            event_types = (event_filter,)
+        else:
+            event_types = dict.fromkeys(event_filter)
 
-        # Add the subscription to the list of subscriptions
+        # Find the subscriptions to add the callback to
         if id_filter is None:
-            self._subscriptions.append(subscription)
+            subscriptions = [self._subscriptions]
         else:
-            for vid in id_filter:
-                if vid not in self._id_subscriptions:
-                    self._id_subscriptions[vid] = []
-                self._id_subscriptions[vid].append(subscription)
+            subscriptions = [
+                self._id_subscriptions.setdefault(vid, {}) for vid in id_filter
+            ]
+
+        # Check once whether the callback is a coroutine, rather than on every emit
+        entry = Subscription(callback)
+
+        # Add the callback to the subscriptions for each event type. The callback
+        # lists are replaced rather than modified, so that emit can iterate them
+        # safely if a callback subscribes or unsubscribes.
+        for subscription in subscriptions:
+            for event_type in event_types:
+                subscription[event_type] = [*subscription.get(event_type, ()), entry]
 
         # Return a function to unsubscribe
         def unsubscribe() -> None:
-            if id_filter is None:
-                self._subscriptions.remove(subscription)
-            else:
-                for vid in id_filter:
-                    if vid not in self._id_subscriptions:
-                        continue
-                    self._id_subscriptions[vid].remove(subscription)
+            for subscription in subscriptions:
+                for event_type in event_types:
+                    entries = list(subscription.get(event_type, ()))
+                    if entry in entries:
+                        entries.remove(entry)
+                        subscription[event_type] = entries
 
         return unsubscribe
 
@@ -269,35 +381,61 @@ class BaseController(QuerySet[T]):
             obj: The object that the event relates to.
             data: Data to pass to the callback.
         """
+        # Find the subscribers to all objects, and to this object
+        callbacks = self._subscriptions.get(event_type)
+        id_callbacks = None
+        if (id_subscriptions := self._id_subscriptions.get(obj.id)) is not None:
+            id_callbacks = id_subscriptions.get(event_type)
+
+        # Return early if nobody is subscribed to this event
+        if not callbacks and not id_callbacks:
+            return
+
         if data is None:
             data = {}
 
-        # Grab a list of subscribers that care about this object
-        subscribers = self._subscriptions + self._id_subscriptions.get(obj.id, [])
-        for callback, event_filter in subscribers:
-            if event_filter is not None and event_type not in event_filter:
-                continue
+        # Notify subscribers to all objects, then subscribers to this object
+        if callbacks:
+            self._notify(callbacks, event_type, obj, data)
 
-            if iscoroutinefunction(callback):
-                asyncio.create_task(callback(event_type, obj, data))  # noqa: RUF006
-            else:
-                callback(event_type, obj, data)
+        if id_callbacks:
+            self._notify(id_callbacks, event_type, obj, data)
 
     def update_state(self, vid: int, attrs: dict[str, Any]) -> None:
         """Update the attributes of an object and notify subscribers of changes."""
+        if self._pending_state is not None:
+            # While handling an event, merge the updates for each object so
+            # subscribers are only notified once per object
+            if self._handling_event:
+                self._pending_state.setdefault(vid, {}).update(attrs)
+                return
+
+            # Apply any pending updates from events first, so that they don't
+            # overwrite this update when they are flushed
+            if (pending_attrs := self._pending_state.pop(vid, None)) is not None:
+                attrs = pending_attrs | attrs
+
+        self._apply_state(vid, attrs)
+
+    def _apply_state(self, vid: int, attrs: dict[str, Any]) -> None:
+        # Update the attributes of an object and notify subscribers of changes.
         # Ignore updates for objects that this controller doesn't manage
         if (obj := self._items.get(vid)) is None:
             return
 
-        # Check if any state attributes changed and update them
+        # Check if any state attributes changed and update them. Objects are plain
+        # dataclasses, so their fields are read and written in the instance dict
+        field_names = _field_names(type(obj))
+        obj_attrs = obj.__dict__
         attrs_changed = []
         for key, value in attrs.items():
-            try:
-                if getattr(obj, key) != value:
-                    setattr(obj, key, value)
-                    attrs_changed.append(key)
-            except AttributeError:
+            if key not in field_names:
                 self._logger.warning("Object '%d' has no attribute '%s'", obj.id, key)
+                continue
+
+            if obj_attrs[key] != value:
+                obj_attrs[key] = value
+                attrs_changed.append(key)
 
         # Notify subscribers if any attributes changed
         if len(attrs_changed) > 0:
@@ -307,7 +445,115 @@ class BaseController(QuerySet[T]):
                 {"attrs_changed": attrs_changed},
             )
 
-    async def _handle_event(self, event: Event) -> None:
+    def _notify(
+        self,
+        callbacks: Iterable[Subscription[T]],
+        event_type: VantageEvent,
+        obj: T,
+        data: dict[str, Any],
+    ) -> None:
+        # Call each of the callbacks with an event. Coroutine callbacks are queued
+        # and awaited by a fixed pool of workers, rather than each getting a task.
+        for subscription in callbacks:
+            if subscription.is_coroutine:
+                self._start_callback_workers().put_nowait(
+                    (subscription.callback, event_type, obj, data)
+                )
+            else:
+                subscription.callback(event_type, obj, data)
+
+    def _start_callback_workers(self) -> asyncio.Queue[QueuedCallback[T]]:
+        # Return the queue of coroutine callbacks, starting the workers that await
+        # them if they aren't running on the current event loop. Workers remove
+        # themselves when they finish, so they are restarted if they were stopped.
+        loop = asyncio.get_running_loop()
+        if (
+            self._callback_queue is None
+            or not self._callback_workers
+            or self._callback_loop is not loop
+        ):
+            self._stop_callback_workers()
+            self._callback_loop = loop
+            queue: asyncio.Queue[QueuedCallback[T]] = asyncio.Queue()
+            self._callback_queue = queue
+            for _ in range(CALLBACK_WORKERS):
+                worker = loop.create_task(self._callback_worker(queue))
+                worker.add_done_callback(self._callback_workers.discard)
+                self._callback_workers.add(worker)
+
+            return queue
+
+        return self._callback_queue
+
+    def _stop_callback_workers(self) -> None:
+        # Cancel the callback workers, dropping any callbacks that haven't run yet.
+        # Workers left on an event loop that has since closed can't be cancelled.
+        for worker in self._callback_workers:
+            if not worker.get_loop().is_closed():
+                worker.cancel()
+
+        self._callback_workers.clear()
+        self._callback_queue = None
+        self._callback_loop = None
+
+    async def _callback_worker(self, queue: asyncio.Queue[QueuedCallback[T]]) -> None:
+        # Await queued coroutine callbacks, in the order they were queued.
+        while True:
+            callback, event_type, obj, data = await queue.get()
+            try:
+                await cast(Awaitable[None], callback(event_type, obj, data))
+            except Exception:
+                self._logger.exception("Error in event callback %s", callback)
+
+    async def _fetch_object_states(self, vids: Iterable[int]) -> None:
+        # Fetch the state of a number of objects concurrently, limiting how many
+        # objects are being fetched at once.
+        semaphore = asyncio.Semaphore(FETCH_STATE_CONCURRENCY)
+
+        async def fetch_object_state(vid: int) -> None:
+            async with semaphore:
+                await self.fetch_object_state(vid)
+
+        # If any fetch fails, cancel the others and wait for them to finish, so none
+        # are left updating objects after this returns
+        tasks = [asyncio.create_task(fetch_object_state(vid)) for vid in vids]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def _receive_event(self, event: Event) -> None:
+        # Handle an event from the event stream. State changes from events are merged
+        # per object and applied once per event loop iteration, so that events which
+        # arrive together, eg. the channels of an RGB color, or repeated level updates
+        # during a ramp, only notify subscribers once per object.
+        if self._pending_state is None:
+            self._pending_state = {}
+            asyncio.get_running_loop().call_soon(self._flush_pending_state)
+
+        self._handling_event = True
+        try:
+            self._handle_event(event)
+        except Exception:
+            self._logger.exception("Error handling event: %s", event)
+        finally:
+            self._handling_event = False
+
+    def _flush_pending_state(self) -> None:
+        # Apply the state changes merged since the flush was scheduled. An error in
+        # a subscriber doesn't prevent the remaining objects from being updated.
+        pending_state, self._pending_state = self._pending_state or {}, None
+        for vid, attrs in pending_state.items():
+            try:
+                self._apply_state(vid, attrs)
+            except Exception:
+                self._logger.exception("Error updating state of object %d", vid)
+
+    def _handle_event(self, event: Event) -> None:
         # Handle events from the event stream
         if event["type"] == EventType.STATUS:
             # Ignore events for objects that this controller doesn't manage
@@ -318,7 +564,9 @@ class BaseController(QuerySet[T]):
                 # Handle "object interface" status events of the form:
                 # -> S:STATUS <id> <method> <result> <arg1> <arg2> ...
                 method, result, *args = event["args"]
-                self.handle_interface_status(event["id"], method, result, *args)
+                self.handle_interface_status(
+                    event["id"], sys.intern(method), result, *args
+                )
             else:
                 # Handle "category" status events, eg: S:LOAD, S:BLIND, etc
                 self.handle_status(event["id"], event["status_type"], *event["args"])
@@ -327,15 +575,18 @@ class BaseController(QuerySet[T]):
             # We only ever subscribe to STATUS/STATUSEX logs from the enhanced log.
             # These are "object interface" status messages, of the form:
             #   EL: <id> <method> <result> <arg1> <arg2> ...
-            vid_str, method, result, *args = tokenize_response(event["log"])
-            vid = int(vid_str)
+            log = event["log"]
 
-            # Ignore events for objects that this controller doesn't manage
+            # Ignore events for objects that this controller doesn't manage, checking
+            # the id before tokenizing the rest of the message
+            vid = int(log.partition(" ")[0])
             if vid not in self._items:
                 return
 
+            _, method, result, *args = tokenize_response(log)
+
             # Pass the event to the controller
-            self.handle_interface_status(vid, method, result, *args)
+            self.handle_interface_status(vid, sys.intern(method), result, *args)
 
     async def _lazy_initialize(self) -> None:
         # Initialize the controller if it isn't already initialized
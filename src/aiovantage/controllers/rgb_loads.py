@@ -1,5 +1,7 @@
 """Controller holding and managing Vantage RGB loads."""
 
+import asyncio
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from typing_extensions import override
@@ -14,6 +16,16 @@ from aiovantage.query import QuerySet
 
 from .base import BaseController
 
+# The state attribute updated by each color status method
+COLOR_ATTRS = {
+    "RGBLoad.GetHSL": "hsl",
+    "RGBLoad.GetRGB": "rgb",
+    "RGBLoad.GetRGBW": "rgbw",
+}
+
+# Handles a status message, adding any state changes to the state dict
+StatusHandler = Callable[[RGBLoadBase, dict[str, Any], str, str, tuple[str, ...]], None]
+
 
 class RGBLoadsController(
     BaseController[RGBLoadBase],
@@ -36,59 +48,49 @@ class RGBLoadsController(
     """Which object interface status messages this controller handles, if any."""
 
     def __post_init__(self) -> None:
-        """Initialize the map for building colors."""
-        self._temp_color_map: dict[int, list[int]] = {}
+        """Initialize the map for building colors, and the status handlers."""
+        self._temp_color_map: dict[tuple[int, str], tuple[list[int], int]] = {}
+        self._status_handlers: dict[str, StatusHandler] = {
+            "Load.GetLevel": self._handle_level_status,
+            "RGBLoad.GetHSL": self._handle_color_status,
+            "RGBLoad.GetRGB": self._handle_color_status,
+            "RGBLoad.GetRGBW": self._handle_color_status,
+            "ColorTemperature.Get": self._handle_color_temp_status,
+        }
 
     @override
     async def fetch_object_state(self, vid: int) -> None:
         """Fetch the state properties of an RGB load."""
-        state: dict[str, Any] = {
-            "level": await LoadInterface.get_level(self, vid),
+        rgb_load: RGBLoadBase = self[vid]
+
+        # Fetch the state properties concurrently, the requests are pipelined
+        requests: dict[str, Awaitable[Any]] = {
+            "level": LoadInterface.get_level(self, vid),
         }
 
-        rgb_load: RGBLoadBase = self[vid]
         if rgb_load.is_rgb:
-            state["hsl"] = await RGBLoadInterface.get_hsl_color(self, vid)
-            state["rgb"] = await RGBLoadInterface.get_rgb_color(self, vid)
-            state["rgbw"] = await RGBLoadInterface.get_rgbw_color(self, vid)
+            requests["hsl"] = RGBLoadInterface.get_hsl_color(self, vid)
+            requests["rgb"] = RGBLoadInterface.get_rgb_color(self, vid)
+            requests["rgbw"] = RGBLoadInterface.get_rgbw_color(self, vid)
 
         if rgb_load.is_cct:
-            state["color_temp"] = await ColorTemperatureInterface.get_color_temp(
-                self, vid
-            )
+            requests["color_temp"] = ColorTemperatureInterface.get_color_temp(self, vid)
 
-        self.update_state(vid, state)
+        results = await asyncio.gather(*requests.values())
+        self.update_state(vid, dict(zip(requests, results, strict=True)))
 
     @override
     def handle_interface_status(
         self, vid: int, method: str, result: str, *args: str
     ) -> None:
         """Handle object interface status messages from the event stream."""
-        rgb_load: RGBLoadBase = self[vid]
-        state: dict[str, Any] = {}
-
-        if method == "Load.GetLevel":
-            state["level"] = self.parse_response(method, result, *args)
-
-        elif method == "RGBLoad.GetHSL" and rgb_load.is_rgb:
-            if color := self._parse_color_channel_response(vid, method, result, *args):
-                state["hsl"] = color
-
-        elif method == "RGBLoad.GetRGB" and rgb_load.is_rgb:
-            if color := self._parse_color_channel_response(vid, method, result, *args):
-                state["rgb"] = color
-
-        elif method == "RGBLoad.GetRGBW" and rgb_load.is_rgb:
-            if color := self._parse_color_channel_response(vid, method, result, *args):
-                state["rgbw"] = color
-
-        elif method == "ColorTemperature.Get" and rgb_load.is_cct:
-            state["color_temp"] = self.parse_response(method, result, *args)
-
-        else:
+        if (handler := self._status_handlers.get(method)) is None:
             return
 
-        self.update_state(vid, state)
+        state: dict[str, Any] = {}
+        handler(self[vid], state, method, result, args)
+        if state:
+            self.update_state(vid, state)
 
     @property
     def is_on(self) -> QuerySet[RGBLoadBase]:
@@ -100,6 +102,46 @@ class RGBLoadsController(
         """Return a queryset of all RGB loads that are turned off."""
         return self.filter(lambda load: not load.is_on)
 
+    def _handle_level_status(
+        self,
+        _rgb_load: RGBLoadBase,
+        state: dict[str, Any],
+        method: str,
+        result: str,
+        args: tuple[str, ...],
+    ) -> None:
+        # Handle "Load.GetLevel" status messages.
+        state["level"] = self.parse_response(method, result, *args)
+
+    def _handle_color_status(
+        self,
+        rgb_load: RGBLoadBase,
+        state: dict[str, Any],
+        method: str,
+        result: str,
+        args: tuple[str, ...],
+    ) -> None:
+        # Handle "RGBLoad.GetHSL", "RGBLoad.GetRGB", and "RGBLoad.GetRGBW" messages.
+        if not rgb_load.is_rgb:
+            return
+
+        if color := self._parse_color_channel_response(
+            rgb_load.id, method, result, *args
+        ):
+            state[COLOR_ATTRS[method]] = color
+
+    def _handle_color_temp_status(
+        self,
+        rgb_load: RGBLoadBase,
+        state: dict[str, Any],
+        method: str,
+        result: str,
+        args: tuple[str, ...],
+    ) -> None:
+        # Handle "ColorTemperature.Get" status messages.
+        if rgb_load.is_cct:
+            state["color_temp"] = self.parse_response(method, result, *args)
+
     def _parse_color_channel_response(
         self, vid: int, method: str, result: str, *args: str
     ) -> tuple[int, ...] | None:
@@ -124,14 +166,17 @@ class RGBLoadsController(
         if response.channel < 0 or response.channel >= num_channels:
             return None
 
-        # Store the channel value in the temp color map
-        self._temp_color_map.setdefault(vid, num_channels * [0])
-        self._temp_color_map[vid][response.channel] = response.value
+        # Store the channel value in the temp color map, along with a bitmask of
+        # which channels have been received, since they may arrive in any order.
+        key = (vid, method)
+        channels, received = self._temp_color_map.get(key) or (num_channels * [0], 0)
+        channels[response.channel] = response.value
+        received |= 1 << response.channel
 
         # If we have all the channels, build and return the color
-        if response.channel == num_channels - 1:
-            color = tuple(self._temp_color_map[vid])
-            del self._temp_color_map[vid]
-            return color
+        if received == (1 << num_channels) - 1:
+            self._temp_color_map.pop(key, None)
+            return tuple(channels)
 
+        self._temp_color_map[key] = (channels, received)
         return None